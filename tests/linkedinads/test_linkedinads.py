@@ -1,6 +1,9 @@
+import re
+
 import pandas as pd
 import pytest
 import responses
+from aioresponses import aioresponses
 from pytest import fixture
 
 from toucan_connectors.common import HttpError
@@ -105,6 +108,22 @@ def test__retrieve_data(connector, create_datasource):
     )
 
 
+def test__retrieve_many(connector, create_datasource):
+    """It should fetch one DataFrame per data source with concurrent requests."""
+    other_datasource = create_datasource.copy(update={'flatten_column': None})
+    with aioresponses() as aiomock:
+        aiomock.get(
+            re.compile(r'https://api\.linkedin\.com/v2/adAnalyticsV2.*'),
+            payload={'elements': [{'bla': 'bla', 'nested': {'kikoo': 'lool'}}]},
+            repeat=True,
+        )
+        dfs = connector._retrieve_many([create_datasource, other_datasource])
+
+    assert len(dfs) == 2
+    assert 'nested.kikoo' in dfs[0].columns
+    assert dfs[1]['bla'][0] == 'bla'
+
+
 @responses.activate
 def test__retrieve_data_no_nested_col(connector, create_datasource):
     create_datasource.flatten_column = None
@@ -212,3 +231,13 @@ def test__retrieve_data_date_fallback(connector, create_datasource):
         '&objectiveType=VIDEO_VIEW'
         '&campaigns=urn:li:sponsoredCampaign:123456,urn:li:sponsoredCampaign:654321'
     )
+
+
+def test_datasource_rejects_malformed_date():
+    """It should reject an unparseable date at datasource construction"""
+    with pytest.raises(ValueError):
+        LinkedinadsDataSource(
+            name='test_name',
+            domain='test_domain',
+            start_date='not a date',
+        )
@@ -1,15 +1,8 @@
-import pytest
-import responses
 from aioresponses import aioresponses
 
 import toucan_connectors.wootric.wootric_connector as woot
 
 
-@pytest.fixture
-def empty_token_cache():
-    woot._TOKEN_CACHE = None
-
-
 def test_wootric_url():
     assert woot.wootric_url('foo') == 'https://api.wootric.com/foo'
     assert woot.wootric_url('/foo') == 'https://api.wootric.com/foo'
@@ -92,8 +85,7 @@ def test_fetch_data_filter_props():
         ]
 
 
-@responses.activate
-def test_wootric_get_df(empty_token_cache):
+def test_wootric_get_df():
     datasource = woot.WootricDataSource(
         name='test',
         domain='test',
@@ -105,12 +97,11 @@ def test_wootric_get_df(empty_token_cache):
     connector = woot.WootricConnector(
         name='wootric', type='wootric', client_id='cid', client_secret='cs'
     )
-    responses.add(
-        responses.POST,
-        'https://api.wootric.com/oauth/token',
-        json={'access_token': 'x', 'expires_in': 10},
-    )
     with aioresponses() as aiomock:
+        aiomock.post(
+            'https://api.wootric.com/oauth/token',
+            payload={'access_token': 'x', 'expires_in': 10},
+        )
         base_query = 'https://api.wootric.com/v1/responses?access_token=x'
         for i in range(8):
             aiomock.get(
@@ -130,38 +121,79 @@ def test_wootric_get_df(empty_token_cache):
     ]
 
 
-@responses.activate
-def test_token_cache_hit(mocker, empty_token_cache):
+def get_access_token(connector):
+    """drive the async token helper the way _retrieve_data does"""
+    loop = woot.get_loop()
+    session = loop.run_until_complete(woot._open_session(1))
+    try:
+        return loop.run_until_complete(woot.access_token(connector, session))
+    finally:
+        loop.run_until_complete(session.close())
+
+
+def test_token_cache_hit(mocker):
     connector = woot.WootricConnector(
         name='wootric', type='wootric', client_id='cid', client_secret='cs'
     )
-    responses.add(
-        responses.POST,
-        'https://api.wootric.com/oauth/token',
-        json={'access_token': 'x', 'expires_in': 10},
-    )
-    mocker.spy(woot.WootricConnector, 'fetch_access_token')
-    assert woot.access_token(connector) == 'x'
-    assert woot.access_token(connector) == 'x'
+    with aioresponses() as aiomock:
+        aiomock.post(
+            'https://api.wootric.com/oauth/token',
+            payload={'access_token': 'x', 'expires_in': 10},
+            repeat=True,
+        )
+        mocker.spy(woot.WootricConnector, 'fetch_access_token')
+        assert get_access_token(connector) == 'x'
+        assert get_access_token(connector) == 'x'
     # fetch_access_token should have been called only once despite `access_token()`
     # was called twice
     assert connector.fetch_access_token.call_count == 1
 
 
-@responses.activate
-def test_token_cache_miss(mocker, empty_token_cache):
+def test_token_cache_miss(mocker):
     connector = woot.WootricConnector(
         name='wootric', type='wootric', client_id='cid', client_secret='cs'
     )
     # HACK: use a negative expire
-    responses.add(
-        responses.POST,
-        'https://api.wootric.com/oauth/token',
-        json={'access_token': 'x', 'expires_in': -10},
-    )
-    mocker.spy(woot.WootricConnector, 'fetch_access_token')
-    assert woot.access_token(connector) == 'x'
-    assert woot.access_token(connector) == 'x'
+    with aioresponses() as aiomock:
+        aiomock.post(
+            'https://api.wootric.com/oauth/token',
+            payload={'access_token': 'x', 'expires_in': -10},
+            repeat=True,
+        )
+        mocker.spy(woot.WootricConnector, 'fetch_access_token')
+        assert get_access_token(connector) == 'x'
+        assert get_access_token(connector) == 'x'
     # fetch_access_token should have been called twice since the token is marked
     # as expired
     assert connector.fetch_access_token.call_count == 2
+
+
+def test_wootric_get_df_with_dtypes():
+    datasource = woot.WootricDataSource(
+        name='test',
+        domain='test',
+        query='responses',
+        properties=['page', 'y'],
+        dtypes={'page': 'int64', 'y': 'float64'},
+        batch_size=10,
+        max_pages=3,
+    )
+    connector = woot.WootricConnector(
+        name='wootric', type='wootric', client_id='cid', client_secret='cs'
+    )
+    with aioresponses() as aiomock:
+        aiomock.post(
+            'https://api.wootric.com/oauth/token',
+            payload={'access_token': 'x', 'expires_in': 10},
+        )
+        base_query = 'https://api.wootric.com/v1/responses?access_token=x'
+        for i in range(8):
+            aiomock.get(
+                f'{base_query}&page={i}&per_page=10',
+                status=200,
+                payload=[{'page': i, 'x': 1, 'y': 2}],
+            )
+        df = connector.get_df(datasource)
+    assert df.dtypes['page'].name == 'int64'
+    assert df.dtypes['y'].name == 'float64'
+    assert df['page'].tolist() == [1, 2, 3]
@@ -1,11 +1,63 @@
+import logging
+import re
+import time
 from contextlib import suppress
-from typing import Any, Dict, Type
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Type
 
 import clickhouse_driver
+import pandas as pd
 from pydantic import Field, SecretStr, constr, create_model
 
-from toucan_connectors.common import pandas_read_sql
-from toucan_connectors.toucan_connector import ToucanConnector, ToucanDataSource, strlist_to_enum
+from toucan_connectors.common import adapt_param_type, convert_to_printf_templating_style
+from toucan_connectors.connection_manager import ConnectionManager
+from toucan_connectors.toucan_connector import (
+    DataSlice,
+    DataStats,
+    ToucanConnector,
+    ToucanDataSource,
+    strlist_to_enum,
+)
+
+logger = logging.getLogger(__name__)
+
+clickhouse_connection_manager = None
+if not clickhouse_connection_manager:
+    clickhouse_connection_manager = ConnectionManager(
+        name='clickhouse', timeout=10, wait=0.2, time_between_clean=10, time_keep_alive=600
+    )
+
+# Identifiers interpolated in generated queries ('db.table' at most)
+_VALID_IDENTIFIER = re.compile(r'^[\w.]+$')
+
+# Queries that already paginate themselves are passed through untouched
+_HAS_LIMIT = re.compile(r'\blimit\b', re.IGNORECASE)
+
+# How long (in seconds) schema discovery results are served from memory
+FORM_CACHE_TTL = 60
+
+# Number of rows per streamed block when fetching results
+BLOCK_SIZE = 65536
+
+
+def _ttl_hash(ttl: int = FORM_CACHE_TTL) -> int:
+    """Buckets the clock so lru_cache entries below expire after `ttl` seconds."""
+    return round(time.time() / ttl)
+
+
+@lru_cache(maxsize=64)
+def _available_databases(client, ttl_hash: int) -> List[str]:
+    res = client.execute('SHOW DATABASES')
+    return [db_name for (db_name,) in res if db_name != 'system']
+
+
+@lru_cache(maxsize=64)
+def _available_tables(client, database: str, ttl_hash: int) -> List[str]:
+    res = client.execute(
+        'SELECT name FROM system.tables WHERE database = %(db)s', {'db': database}
+    )
+    return [table[0] for table in res]
 
 
 class ClickhouseDataSource(ToucanDataSource):
@@ -44,6 +96,8 @@ class ClickhouseDataSource(ToucanDataSource):
         if query is None and table is None:
             raise ValueError("'query' or 'table' must be set")
         elif query is None and table is not None:
+            if not _VALID_IDENTIFIER.match(table):
+                raise ValueError(f'Invalid table name: {table}')
             self.query = f'select * from {table};'
 
     @classmethod
@@ -56,23 +110,18 @@ class ClickhouseDataSource(ToucanDataSource):
         """
         constraints = {}
 
-        with suppress(Exception):
-            connection = clickhouse_driver.connect(connector.get_connection_url())
-            # Always add the suggestions for the available databases
+        with suppress(Exception), connector._get_connection() as client:
+            # Always add the suggestions for the available databases.
+            # Discovery queries are served from a short-lived cache so rapid
+            # successive form renders don't hammer ClickHouse
+            available_dbs = _available_databases(client, _ttl_hash())
+            constraints['database'] = strlist_to_enum('database', available_dbs)
 
-            with connection.cursor() as cursor:
-                cursor.execute('SHOW DATABASES')
-                res = cursor.fetchall()
-                available_dbs = [db_name for (db_name,) in res if db_name != 'system']
-                constraints['database'] = strlist_to_enum('database', available_dbs)
-
-                if 'database' in current_config:
-                    cursor.execute(
-                        f"""SELECT name FROM system.tables WHERE database = '{current_config["database"]}'"""
-                    )
-                    res = cursor.fetchall()
-                    available_tables = [table[0] for table in res]
-                    constraints['table'] = strlist_to_enum('table', available_tables, None)
+            if 'database' in current_config:
+                available_tables = _available_tables(
+                    client, current_config['database'], _ttl_hash()
+                )
+                constraints['table'] = strlist_to_enum('table', available_tables, None)
 
         return create_model('FormSchema', **constraints, __base__=cls).schema()
 
@@ -97,18 +146,95 @@ class ClickhouseConnector(ToucanConnector):
         proto = 'clickhouses' if self.ssl_connection else 'clickhouse'
         return f'{proto}://{self.user}:{self.password.get_secret_value() if self.password else ""}@{self.host}:{self.port}/{database}'
 
-    def _retrieve_data(self, data_source):
-        connection = clickhouse_driver.connect(
-            self.get_connection_url(database=data_source.database)
+    @staticmethod
+    def get_clickhouse_connection_manager():
+        return clickhouse_connection_manager
+
+    def _get_connection(self, database: str = 'default'):
+        """Retrieve a pooled native client, kept alive across queries by the connection manager."""
+        url = self.get_connection_url(database=database)
+
+        def connect_function():
+            logger.info('Connect at Clickhouse')
+            return clickhouse_driver.Client.from_url(url)
+
+        def alive_function(client):
+            return client.connection.connected
+
+        def close_function(client):
+            logger.info('Close Clickhouse connection')
+            return client.disconnect()
+
+        return clickhouse_connection_manager.get(
+            identifier=f'{self.get_identifier()}{database}',
+            connect_method=connect_function,
+            alive_method=alive_function,
+            close_method=close_function,
+            save=True,
         )
+
+    def _retrieve_data(self, data_source):
         query_params = data_source.parameters or {}
         query = (
             data_source.query
             if data_source.query
             else f'select * from {data_source.table} limit 50;'
         )
-        df = pandas_read_sql(query, con=connection, params=query_params, adapt_params=True)
-
-        connection.close()
-
-        return df
+        query = convert_to_printf_templating_style(query)
+        # Results are streamed in bounded blocks so the peak footprint is one
+        # block of row tuples plus the final DataFrame, instead of the whole
+        # result set twice
+        with self._get_connection(database=data_source.database) as client:
+            rows = client.execute_iter(
+                query,
+                params=adapt_param_type(query_params),
+                with_column_types=True,
+                settings={'max_block_size': BLOCK_SIZE},
+            )
+            columns = [name for name, _ in next(rows)]
+            blocks = []
+            while block := list(islice(rows, BLOCK_SIZE)):
+                blocks.append(pd.DataFrame(block, columns=columns))
+
+        if not blocks:
+            return pd.DataFrame(columns=columns)
+        if len(blocks) == 1:  # the common case: no concat copy
+            return blocks[0]
+        return pd.concat(blocks, copy=False, ignore_index=True)
+
+    def get_slice(
+        self,
+        data_source: ClickhouseDataSource,
+        permissions: Optional[dict] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        get_row_count: Optional[bool] = False,
+    ) -> DataSlice:
+        """Paginate server-side when possible, so only the requested page travels over the wire."""
+        # Permission filtering happens in pandas after retrieval, and a query
+        # with its own LIMIT has pagination semantics we must not alter:
+        # in both cases fall back to slicing the full result
+        if limit is None or permissions is not None or _HAS_LIMIT.search(data_source.query):
+            return super().get_slice(
+                data_source, permissions, offset=offset, limit=limit, get_row_count=get_row_count
+            )
+
+        subquery = data_source.query.rstrip('; ')
+        paginated_query = f'SELECT * FROM ({subquery}) LIMIT {limit} OFFSET {offset}'
+        df = self.get_df(data_source.copy(update={'query': paginated_query}))
+        total_rows = None
+        if get_row_count:
+            # the dataset total is no longer known from the page alone:
+            # let ClickHouse count it instead of retrieving everything
+            count_df = self.get_df(
+                data_source.copy(update={'query': f'SELECT count() FROM ({subquery})'})
+            )
+            total_rows = int(count_df.iloc[0, 0])
+        return DataSlice(
+            df,
+            stats=DataStats(
+                total_rows=total_rows,
+                total_returned_rows=len(df),
+                df_memory_size=df.memory_usage().sum(),
+            ),
+        )
@@ -4,6 +4,7 @@ import dataclasses
 import logging
 import re
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, List, Optional, Tuple
 
 import pandas as pd
@@ -218,8 +219,14 @@ def apply_query_parameters(query: str, parameters: dict) -> str:
 # jq filtering
 
 
+@lru_cache(maxsize=256)
+def _compile_jq(jq_filter: str):
+    """Compiled jq programs are cached: connectors reapply the same filter on every request."""
+    return pyjq.compile(jq_filter)
+
+
 def transform_with_jq(data: object, jq_filter: str) -> list:
-    data = pyjq.all(jq_filter, data)
+    data = _compile_jq(jq_filter).all(data)
 
     # jq 'multiple outout': the data is already presented as a list of rows
     multiple_output = len(data) == 1 and isinstance(data[0], list)
@@ -342,6 +349,8 @@ def adapt_param_type(params):
     passing a list parameter it should be converted to tuple in order for
     postgres to correctly interpret them as an array.
     """
+    if not params:
+        return {}
     return {k: (tuple(v) if isinstance(v, list) else v) for (k, v) in params.items()}
 
 
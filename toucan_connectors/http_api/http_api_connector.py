@@ -2,6 +2,11 @@ from enum import Enum
 from typing import Any, Dict, List, Type, Union
 from xml.etree.ElementTree import ParseError, fromstring, tostring
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 import pandas as pd
 from pydantic import AnyHttpUrl, BaseModel, Field, FilePath
 from requests import Session
@@ -18,6 +23,26 @@ from toucan_connectors.common import (
 from toucan_connectors.toucan_connector import ToucanConnector, ToucanDataSource
 
 
+if lxml_etree is not None:
+    # libxml2's C parser is several times faster than the pure-Python one
+    # on multi-KB documents; entity resolution and network access are
+    # disabled as this parses untrusted API responses
+    def parse_xml(content):
+        # parser instances are not thread-safe, so build one per call;
+        # construction is cheap next to the parse itself
+        parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+        try:
+            return lxml_etree.fromstring(content, parser=parser)
+        except lxml_etree.XMLSyntaxError as e:
+            # keep the stdlib exception as the public error contract
+            raise ParseError(str(e)) from e
+
+    xml_to_bytes = lxml_etree.tostring
+else:
+    parse_xml = fromstring
+    xml_to_bytes = tostring
+
+
 class ResponseType(str, Enum):
     json = 'json'
     xml = 'xml'
@@ -146,8 +171,8 @@ class HttpAPIConnector(ToucanConnector):
 
         if self.responsetype == 'xml':
             try:
-                data = fromstring(res.content)
-                data = parse(tostring(data.find(xpath), method='xml'), attr_prefix='')
+                data = parse_xml(res.content)
+                data = parse(xml_to_bytes(data.find(xpath), method='xml'), attr_prefix='')
             except ParseError:
                 HttpAPIConnector.logger.error(f'Could not decode {res.content!r}')
                 raise
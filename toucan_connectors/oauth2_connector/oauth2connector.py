@@ -26,13 +26,16 @@ class SecretsKeeper(ABC):
 
 
 class OAuth2ConnectorConfig(BaseModel):
+    # .schema() is served from pydantic's per-model __schema_cache__, so
+    # callers (secrets forms, init_params below) may call it freely
     client_id: str
     client_secret: SecretStr
 
 
 class OAuth2Connector:
-    init_params = ['secrets_keeper', 'redirect_uri'] + list(
-        OAuth2ConnectorConfig.schema()['properties'].keys()
+    # frozenset: connectors filter their kwargs against it on every __init__
+    init_params = frozenset(
+        ['secrets_keeper', 'redirect_uri'] + list(OAuth2ConnectorConfig.schema()['properties'])
     )
 
     def __init__(
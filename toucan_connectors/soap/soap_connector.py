@@ -1,10 +1,11 @@
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
 
 import pandas as pd
-from pydantic import Field, create_model
+from pydantic import Field, PrivateAttr, create_model
 from requests import Session
 from toucan_data_sdk.utils.postprocess.json_to_table import json_to_table
 from zeep import Client
+from zeep.cache import InMemoryCache
 from zeep.helpers import serialize_object
 from zeep.transports import Transport
 
@@ -40,7 +41,7 @@ class SoapDataSource(ToucanDataSource):
     @classmethod
     def get_form(cls, connector: 'SoapConnector', current_config):
         constraints = {}
-        client = connector.create_client()
+        client = connector._get_client()
         methods_docs = cls._get_methods_docs(client)
         constraints['method'] = strlist_to_enum('method', list(methods_docs.keys()))
 
@@ -61,17 +62,28 @@ class SoapConnector(ToucanConnector):
     endpoint: str = Field(
         ..., title='WSDL Endpoint', description='The URL where the WSDL file is located'
     )
+    _client: Optional[Client] = PrivateAttr(default=None)
 
     def create_client(self) -> Client:
         session = Session()
         if self.headers:
             session.headers.update(self.headers)
-        return Client(self.endpoint, transport=Transport(session=session))
+        # The cache keeps WSDL documents (and their imports) in memory so
+        # rebuilding a client does not re-download them
+        return Client(
+            self.endpoint, transport=Transport(session=session, cache=InMemoryCache(timeout=3600))
+        )
+
+    def _get_client(self) -> Client:
+        """Reuse the zeep client: parsing the WSDL dominates its construction."""
+        if self._client is None:
+            self._client = self.create_client()
+        return self._client
 
     def _retrieve_data(self, data_source: SoapDataSource) -> pd.DataFrame:
         # Instantiate the SOAP client
 
-        client = self.create_client()
+        client = self._get_client()
         response = serialize_object(
             getattr(client.service, data_source.method)(**data_source.parameters)
         )
@@ -6,12 +6,12 @@ import socket
 import uuid
 from abc import ABC, ABCMeta, abstractmethod
 from enum import Enum
-from functools import reduce, wraps
+from functools import lru_cache, reduce, wraps
 from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
 
 import pandas as pd
 import tenacity as tny
-from pydantic import BaseModel, Field, SecretBytes, SecretStr
+from pydantic import BaseModel, Field, PrivateAttr, SecretBytes, SecretStr
 
 from toucan_connectors.common import (
     ConnectorStatus,
@@ -70,6 +70,12 @@ class StrEnum(str, Enum):
     """Class to easily make schemas with enum values and type string"""
 
 
+@lru_cache(maxsize=512)
+def _make_enum(field: str, values: Tuple[str, ...]) -> Type[StrEnum]:
+    """Dynamic Enum creation is costly; form renders re-request the same (field, values) pairs."""
+    return StrEnum(field, {v: v for v in values})
+
+
 def strlist_to_enum(field: str, strlist: List[str], default_value=...) -> tuple:
     """
     Convert a list of strings to a pydantic schema enum
@@ -77,7 +83,7 @@ def strlist_to_enum(field: str, strlist: List[str], default_value=...) -> tuple:
     If the field is required, the <default value> has to be '...' (cf pydantic doc)
     By default, the field is considered required.
     """
-    return StrEnum(field, {v: v for v in strlist}), default_value
+    return _make_enum(field, tuple(strlist)), default_value
 
 
 class ToucanDataSource(BaseModel):
@@ -289,6 +295,10 @@ class ToucanConnector(BaseModel, metaclass=ABCMeta):
     # Used to defined the connection
     identifier: str = Field(None, **{'ui.hidden': True})
 
+    # Memoized result of `get_unique_identifier`: serializing the whole model
+    # is too expensive to redo for every cache-key computation
+    _unique_identifier: Optional[str] = PrivateAttr(default=None)
+
     class Config:
         extra = 'forbid'
         validate_assignment = True
@@ -341,7 +351,9 @@ class ToucanConnector(BaseModel, metaclass=ABCMeta):
         filtered by permissions
         """
         res = self._retrieve_data(data_source)
-        res.columns = res.columns.astype(str)
+        # Rebuilding the Index is only needed when some labels are not strings
+        if any(not isinstance(c, str) for c in res.columns):
+            res.columns = res.columns.astype(str)
 
         if permissions is not None:
             permissions_query = PandasConditionTranslator.translate(permissions)
@@ -370,7 +382,8 @@ class ToucanConnector(BaseModel, metaclass=ABCMeta):
             rows from a request, before limit (Snowflake)
         """
         df = self.get_df(data_source, permissions)
-        truncated_df = df[offset : offset + limit] if limit is not None else df[offset:]
+        # iloc slicing returns a view: no row copy for the pagination path
+        truncated_df = df.iloc[offset : offset + limit] if limit is not None else df.iloc[offset:]
         return DataSlice(
             truncated_df,
             stats=DataStats(
@@ -427,6 +440,25 @@ class ToucanConnector(BaseModel, metaclass=ABCMeta):
         """
         return self.json()
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # any field mutation changes the serialized config: drop the memo
+        if name in self.__fields__:
+            self._unique_identifier = None
+
+    def copy(self, *, update=None, **kwargs):
+        copied = super().copy(update=update, **kwargs)
+        # pydantic's copy() carries private attributes over, so a copy with
+        # updated fields must not reuse the stale serialized-config memo
+        if update:
+            copied._unique_identifier = None
+        return copied
+
+    def _cached_unique_identifier(self) -> str:
+        if self._unique_identifier is None:
+            self._unique_identifier = self.get_unique_identifier()
+        return self._unique_identifier
+
     def _get_unique_datasource_identifier(self, data_source: ToucanDataSource) -> dict:
         # By default we don't know which variable syntax is be supported by the inheriting connector,
         # so calling `nosql_apply_parameters_to_query` is wrong and will produce the same cache key
@@ -448,7 +480,7 @@ class ToucanConnector(BaseModel, metaclass=ABCMeta):
         This identifier will then be used as a cache key.
         """
         unique_identifier = {
-            'connector': self.get_unique_identifier(),
+            'connector': self._cached_unique_identifier(),
             'permissions': nosql_apply_parameters_to_query(permissions, data_source.parameters)
             if data_source
             else permissions,
@@ -463,7 +495,7 @@ class ToucanConnector(BaseModel, metaclass=ABCMeta):
         return string_uid
 
     def get_identifier(self):
-        json_uid = JsonWrapper.dumps(self.get_unique_identifier(), sort_keys=True)
+        json_uid = JsonWrapper.dumps(self._cached_unique_identifier(), sort_keys=True)
         string_uid = str(uuid.uuid3(uuid.NAMESPACE_OID, json_uid))
         return string_uid
 